@@ -32,6 +32,10 @@ Usage:
 """
 
 import argparse
+import datetime
+import os
+import re
+import select
 import sys
 import time
 from pathlib import Path
@@ -45,14 +49,92 @@ except ImportError:
     sys.exit(1)
 
 
+# Longest partial line buffered while no newline arrives (guards against corrupted dumps)
+_MAX_LINE_BYTES = 4096
+
+# USB VID:PID of the serial interfaces found on SEN66 boards: ESP32-S3 native
+# USB, CP210x and CH340 bridges
+_BOARD_USB_IDS = {(0x303A, 0x1001), (0x10C4, 0xEA60), (0x1A86, 0x7523)}
+
+# Periodic sensor measurement output interleaved with command responses
+_SENSOR_KEYWORDS_RE = re.compile(r'PM1\.0|PM2\.5|PM4\.0|PM10|Temperature|Humidity|VOC|NOx|CO2|Timestamp|Fast TWA|Export TWA')
+
+# Lines belonging to the responses of the rtc/storage commands
+_RTC_LINES_RE = re.compile(r'RTC Status|═══|Initialized:|Current Time:|Last Sync:|Time Since Sync:|'
+                           r'Needs Sync:|Active Source:|RTC Time|Legacy Sync|Millis Only')
+_RTC_SYNC_LINES_RE = re.compile(r'\[RTC\]|Setting RTC time|RTC time set|Failed to set RTC|'
+                                r'(?i:synchronized|error|power cycles)')
+_RTC_SYNC_DONE_RE = re.compile(r'synchronized|error|power cycles', re.IGNORECASE)
+_MEASUREMENT_START_RE = re.compile(r'Measurement #|ENVIRONMENTAL')
+_STORAGE_LINES_RE = re.compile(r'Storage|Total Capacity|Used:|Free:|bytes/entry|Estimated remaining|'
+                               r'Warning threshold|WARNING|═══')
+
+# Final lines of the clear, meta and resetmeta exchanges
+_CLEAR_DONE_RE = re.compile(r'cleared|cancelled', re.IGNORECASE)
+_META_PROMPT_DONE_RE = re.compile(r'choice:|Metadata set:|cancelled|unchanged', re.IGNORECASE)
+_META_SET_DONE_RE = re.compile(r'Metadata set:|cancelled', re.IGNORECASE)
+_META_DOWNLOAD_DONE_RE = re.compile(rb'You can now:')
+_RESET_DONE_RE = re.compile(r'reset to defaults|cancelled', re.IGNORECASE)
+
+# Tagged line from the board's dump commands: [COMMENT], [HEADER], then
+# [<row number>] rows from dump or [DATA] rows from dump_twa
+_DUMP_TAG_RE = re.compile(rb'^\[\s*(COMMENT|HEADER|DATA|\d+)\s*\](.*)$')
+
+# Fast path for the data rows that make up almost all of a dump: the tag and
+# the presence of a comma are checked in one match, leaving the CSV part
+_DATA_LINE_RE = re.compile(rb'^\[\s*(?:\d+|DATA)\s*\]\s*(.*,.*)$')
+
+# Echoed dump lines are written to stdout in batches of this size
+_ECHO_BATCH_LINES = 256
+
+# Deleting these from a line leaves only its unexpected control bytes
+_NON_CONTROL_BYTES = bytes(range(32, 256)) + b'\n\r\t'
+
+
+# Text printed by the about command
+_ABOUT_TEXT = """
+================================================================================
+  OSH-Monitor Project Information
+================================================================================
+
+Project: OSH-Monitor
+Creator: Christopher Lee
+License: GNU General Public License v3.0 (GPLv3)
+
+Description:
+  Advanced air quality monitoring system with the Sensirion SEN66 sensor
+  Features real-time measurements, 8-hour TWA calculations, CSV logging,
+  and localized timestamps with configurable UTC offset.
+
+License Notice:
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+  GNU General Public License for more details.
+
+================================================================================
+
+"""
+
+
 class SEN66CLI:
     """CLI interface for OSH-Monitor board"""
     
+    # Wire form of the fixed commands, encoded on first use
+    _CMD_CACHE = {}
+    
     def __init__(self, port=None, baudrate=115200, timeout=2):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.ser = None
+        self._rx_buf = bytearray()  # Received bytes not yet consumed as lines
+        self._fd = None  # Port file descriptor read directly on POSIX
         
     def connect(self):
         """Connect to the serial port"""
@@ -63,10 +145,24 @@ class SEN66CLI:
                 return False
                 
         try:
-            self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
-            time.sleep(0.5)  # Allow connection to stabilize
+            self.ser = serial.Serial(self.port, self.baudrate, timeout=0.1)
+            # The Windows driver queue defaults to 4 KiB, which a dump fills in
+            # well under a second; other platforms don't offer this call
+            if hasattr(self.ser, 'set_buffer_size'):
+                try:
+                    self.ser.set_buffer_size(rx_size=131072, tx_size=16384)
+                except serial.SerialException:
+                    pass  # Keep the driver's default queue sizes
+            # Allow connection to stabilize: up to 500 ms, but stop as soon as
+            # the board starts talking
+            for _ in range(5):
+                if self.ser.read(1):
+                    break
+            self.ser.timeout = self.timeout
             # Flush any existing data
             self.ser.reset_input_buffer()
+            self._rx_buf.clear()
+            self._fd = self.ser.fileno() if os.name == 'posix' else None
             print(f"Connected to {self.port}")
             return True
         except serial.SerialException as e:
@@ -77,17 +173,28 @@ class SEN66CLI:
         """Disconnect from serial port"""
         if self.ser and self.ser.is_open:
             self.ser.close()
+            self._fd = None
             print("Disconnected")
             
     def auto_detect_port(self):
         """Attempt to auto-detect the SEN66 board"""
         ports = serial.tools.list_ports.comports()
         
-        # Look for ESP32-S3 USB device
+        # Look for a known board USB interface by VID:PID, remembering the first
+        # port whose description suggests another USB bridge, in a single pass
+        described = None
         for port in ports:
-            if "USB" in port.description or "ESP32" in port.description:
+            if port.vid is None:
+                continue  # Not a USB device (e.g. a built-in UART)
+            if (port.vid, port.pid) in _BOARD_USB_IDS:
                 print(f"Auto-detected: {port.device} ({port.description})")
                 return port.device
+            if described is None and ("USB" in port.description or "ESP32" in port.description):
+                described = port
+                
+        if described:
+            print(f"Auto-detected: {described.device} ({described.description})")
+            return described.device
         
         # If nothing found, return first available port
         if ports:
@@ -100,7 +207,22 @@ class SEN66CLI:
         """Flush any pending serial input to clear old measurements"""
         if self.ser and self.ser.is_open:
             self.ser.reset_input_buffer()
-            time.sleep(0.1)
+            self._rx_buf.clear()
+            
+            # Drain whatever is still arriving (e.g. the tail of a measurement
+            # block) until the line stays quiet, rather than sleeping blindly
+            previous_timeout = self.ser.timeout
+            deadline = time.monotonic() + 0.25
+            self.ser.timeout = 0.02
+            try:
+                if self.ser.read(self.ser.in_waiting or 1):
+                    # Each timeout change reconfigures the port, so shorten it
+                    # once rather than on every pass
+                    self.ser.timeout = 0.005
+                    while self.ser.read(self.ser.in_waiting or 1) and time.monotonic() < deadline:
+                        pass
+            finally:
+                self.ser.timeout = previous_timeout
     
     def send_command(self, command, flush_first=True):
         """Send a command to the board"""
@@ -113,29 +235,151 @@ class SEN66CLI:
             if flush_first:
                 self.flush_input_buffer()
             
-            self.ser.write((command + '\n').encode())
-            time.sleep(0.2)  # Give board time to process
+            # No fixed delay here: callers wait for the board's response lines.
+            # Fixed commands come as str and their encoded form is cached;
+            # commands with arguments come pre-encoded (without the newline)
+            # so one-off values don't pile up in the cache
+            if isinstance(command, bytes):
+                payload = command + b'\n'
+            else:
+                payload = self._CMD_CACHE.get(command)
+                if payload is None:
+                    payload = self._CMD_CACHE.setdefault(command, (command + '\n').encode('ascii'))
+            self.ser.write(payload)
             return True
         except Exception as e:
             print(f"Error sending command: {e}")
             return False
             
+    def _read_raw_lines(self, timeout, idle=None, partial=None):
+        """Yield raw lines (without the newline) until timeout (or idle) seconds pass"""
+        # A timeout of None waits for data indefinitely
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        wait = idle if idle and (timeout is None or idle < timeout) else timeout
+        fd = self._fd
+        rx_buf = self._rx_buf  # Cleared in place elsewhere, never rebound
+        pending = []  # Complete lines split off rx_buf but not handed out yet
+        next_line = 0
+        if fd is None:
+            previous_timeout = self.ser.timeout
+        try:
+            while True:
+                # Serve complete lines already buffered before touching the port
+                if next_line < len(pending):
+                    raw_line = pending[next_line]
+                    next_line += 1
+                    yield raw_line
+                    continue
+                    
+                # Split off every complete line received so far in one pass
+                # rather than slicing the buffer once per line
+                end = rx_buf.rfind(b'\n')
+                if end >= 0:
+                    pending = bytes(rx_buf[:end]).split(b'\n')
+                    next_line = 0
+                    del rx_buf[:end + 1]
+                    continue
+                    
+                if len(rx_buf) >= _MAX_LINE_BYTES:
+                    # Runaway line: hand it out in bounded pieces instead of
+                    # buffering until a newline eventually shows up
+                    raw_line = bytes(rx_buf[:_MAX_LINE_BYTES])
+                    del rx_buf[:_MAX_LINE_BYTES]
+                    yield raw_line
+                    continue
+                    
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if remaining < wait:
+                        wait = remaining  # Don't let the last read block past the deadline
+                        
+                # The board prints its prompts without a newline: with partial
+                # set, an unterminated line is handed out once nothing more has
+                # arrived for that long
+                prompt_pending = partial is not None and len(rx_buf) > 0 and (wait is None or partial < wait)
+                read_wait = partial if prompt_pending else wait
+                if fd is not None:
+                    # POSIX: wait for readiness and take everything queued in one
+                    # os.read, skipping pyserial's in_waiting ioctl, per-call
+                    # bookkeeping and the termios update a timeout change costs
+                    if select.select([fd], [], [], read_wait)[0]:
+                        try:
+                            chunk = os.read(fd, 65536)
+                        except BlockingIOError:
+                            continue
+                        if not chunk:
+                            raise serial.SerialException("device reports readiness to read but returned no data")
+                    else:
+                        chunk = b''
+                else:
+                    # A blocking read of one byte waits for data in the driver, then
+                    # everything already queued is drained in the same call
+                    if self.ser.timeout != read_wait:
+                        self.ser.timeout = read_wait
+                    chunk = self.ser.read(self.ser.in_waiting or 1)
+                    
+                if not chunk:
+                    if prompt_pending:
+                        raw_line = bytes(rx_buf)
+                        rx_buf.clear()
+                        yield raw_line
+                        continue
+                    break  # Read timed out with no data
+                rx_buf += chunk
+        finally:
+            if fd is None:
+                self.ser.timeout = previous_timeout
+            # Lines the caller didn't consume stay queued for the next read
+            if next_line < len(pending):
+                rx_buf[:0] = b'\n'.join(pending[next_line:]) + b'\n'
+            
+    def _read_lines(self, timeout, idle=None, partial=None):
+        """Yield decoded lines as they arrive until timeout (or idle) seconds pass"""
+        for raw_line in self._read_raw_lines(timeout, idle, partial):
+            yield raw_line.decode('utf-8', errors='ignore').strip()
+            
+    def _read_response(self, max_wait, stop=None, start=None, show=None, abort=None, idle=None,
+                       partial=None):
+        """Print response lines until one matches stop and return the printed lines"""
+        printed = []
+        started = start is None
+        
+        # Each predicate takes a decoded line: show skips interleaved
+        # measurement output, nothing is printed before a start match, and an
+        # abort match ends the read without being printed
+        for line in self._read_lines(max_wait, idle, partial):
+            if not line:
+                continue
+            if show and not show(line):
+                continue
+            if start and start(line):
+                started = True
+            elif abort and abort(line):
+                break
+            elif not started:
+                continue
+                
+            print(line)
+            printed.append(line)
+            if stop and stop(line):
+                break
+                
+        return printed
+        
     def read_until_prompt(self, timeout=5):
         """Read serial output until we see a measurement or timeout"""
-        start_time = time.time()
         output = []
         
-        while time.time() - start_time < timeout:
-            if self.ser.in_waiting:
-                line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                if line:
-                    output.append(line)
-                    
-                # Stop if we see a complete measurement
-                if "TWA PM10:" in line:
-                    break
-            else:
-                time.sleep(0.1)
+        for raw_line in self._read_raw_lines(timeout):
+            line = raw_line.decode('utf-8', errors='ignore').strip()
+            if line:
+                output.append(line)
+                
+            # Stop if we see a complete measurement
+            if b"TWA PM10:" in raw_line:
+                break
                 
         return output
         
@@ -180,115 +424,47 @@ class SEN66CLI:
         self.flush_input_buffer()
         
         if self.send_command("clear"):
-            # Wait for the board's confirmation prompt
-            time.sleep(0.3)
-            
-            # Read and display the board's warning message
-            prompt_timeout = time.time() + 3
-            while time.time() < prompt_timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        print(line)
-                        if "Type 'yes' to confirm" in line:
-                            break
-                else:
-                    time.sleep(0.1)
+            # Read and display the board's warning message, up to its
+            # confirmation prompt (printed without a newline)
+            self._read_response(3, partial=0.1, stop=lambda line: "Type 'yes' to confirm" in line)
             
             # Get user confirmation
             confirm = input().strip().lower()
             
             # Send confirmation to board
             self.ser.write(f"{confirm}\n".encode())
-            self.ser.flush()
             
             # Read response
             time.sleep(0.5)
-            response_timeout = time.time() + 3
-            while time.time() < response_timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        print(line)
-                        if "cleared" in line.lower() or "cancelled" in line.lower():
-                            break
-                else:
-                    time.sleep(0.1)
-                    if not self.ser.in_waiting:
-                        break
+            self._read_response(3, idle=0.1, stop=_CLEAR_DONE_RE.search)
         else:
             print("Failed to send clear command")
     
-
-    
     def rtc_status(self):
         """Show ESP32 RTC status and timing information"""
         print("\nRetrieving RTC status...")
         
         if self.send_command("rtc status"):
-            time.sleep(0.5)
-            
-            # Read the RTC status response, filtering out sensor measurements
-            timeout = time.time() + 5
-            collecting_response = False
-            rtc_response_complete = False
-            
-            while time.time() < timeout and not rtc_response_complete:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        # Filter out sensor measurement lines
-                        if any(keyword in line for keyword in ["PM1.0", "PM2.5", "PM4.0", "PM10", "Temperature", "Humidity", "VOC", "NOx", "CO2", "Timestamp", "Fast TWA", "Export TWA"]):
-                            continue  # Skip sensor measurement data
-                        
-                        # Only print RTC-related lines
-                        if ("RTC Status" in line or "═══" in line or 
-                            "Initialized:" in line or "Current Time:" in line or 
-                            "Last Sync:" in line or "Time Since Sync:" in line or 
-                            "Needs Sync:" in line or "Active Source:" in line or
-                            "RTC Time" in line or "Legacy Sync" in line or "Millis Only" in line):
-                            print(line)
-                            collecting_response = True
-                            
-                            # Check if this is the end of RTC status
-                            if collecting_response and "Active Source:" in line:
-                                rtc_response_complete = True
-                else:
-                    time.sleep(0.1)
+            # Read the RTC status response, filtering out sensor measurements;
+            # "Active Source:" is the last line of the RTC status
+            self._read_response(
+                5,
+                show=lambda line: not _SENSOR_KEYWORDS_RE.search(line) and _RTC_LINES_RE.search(line),
+                stop=lambda line: "Active Source:" in line)
         else:
             print("Failed to send RTC status command")
     
     def rtc_sync(self):
         """Synchronize the ESP32 RTC with current Unix timestamp"""
-        import time as time_module
-        
-        unix_time = int(time_module.time())
+        unix_time = int(time.time())
         print(f"\nSynchronizing ESP32 RTC to Unix timestamp: {unix_time}")
         
-        if self.send_command(f"rtc sync {unix_time}"):
-            time.sleep(0.5)
-            
+        if self.send_command(f"rtc sync {unix_time}".encode('ascii')):
             # Read the sync response, filtering out sensor measurements
-            timeout = time.time() + 3
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        # Filter out sensor measurement lines
-                        if any(keyword in line for keyword in ["PM1.0", "PM2.5", "PM4.0", "PM10", "Temperature", "Humidity", "VOC", "NOx", "CO2", "Timestamp", "Fast TWA", "Export TWA"]):
-                            continue  # Skip sensor measurement data
-                        
-                        # Only print RTC sync related lines
-                        if ("[RTC]" in line or "synchronized" in line.lower() or 
-                            "error" in line.lower() or "power cycles" in line.lower() or
-                            "Setting RTC time" in line or "RTC time set" in line or
-                            "Failed to set RTC" in line):
-                            print(line)
-                            if ("synchronized" in line.lower() or "error" in line.lower() or 
-                                "power cycles" in line.lower()):
-                                break
-                else:
-                    time.sleep(0.1)
+            self._read_response(
+                3,
+                show=lambda line: not _SENSOR_KEYWORDS_RE.search(line) and _RTC_SYNC_LINES_RE.search(line),
+                stop=_RTC_SYNC_DONE_RE.search)
         else:
             print("Failed to send RTC sync command")
     
@@ -297,30 +473,10 @@ class SEN66CLI:
         print("\nRetrieving storage statistics...")
         
         if self.send_command("storage"):
-            time.sleep(0.5)
-            
             # Read the storage response, filtering out sensor measurements
-            timeout = time.time() + 3
-            lines_found = []
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        # Filter out sensor measurement lines
-                        if any(keyword in line for keyword in ["PM1.0", "PM2.5", "PM4.0", "PM10", "Temperature", "Humidity", "VOC", "NOx", "CO2", "Timestamp", "Fast TWA", "Export TWA"]):
-                            continue
-                        
-                        # Capture storage-related lines
-                        if ("Storage" in line or "Total Capacity" in line or "Used:" in line or 
-                            "Free:" in line or "bytes/entry" in line or "Estimated remaining" in line or
-                            "Warning threshold" in line or "WARNING" in line or "═══" in line):
-                            lines_found.append(line)
-                            print(line)
-                        elif lines_found and line == "":
-                            # End of storage output
-                            break
-                else:
-                    time.sleep(0.1)
+            lines_found = self._read_response(
+                3,
+                show=lambda line: not _SENSOR_KEYWORDS_RE.search(line) and _STORAGE_LINES_RE.search(line))
             
             if not lines_found:
                 print("No storage information received")
@@ -332,37 +488,17 @@ class SEN66CLI:
         print("\nRetrieving configuration...")
         
         if self.send_command("config"):
-            time.sleep(0.5)
-            
-            # Read response, filtering out measurement data
-            timeout = time.time() + 3
-            in_config = False
+            # Read response from the config header up to the tip, filtering
+            # out measurement data
+            lines = self._read_response(
+                3,
+                start=lambda line: "Current Configuration" in line or "═" in line,
+                abort=_MEASUREMENT_START_RE.search,
+                stop=lambda line: "Tip:" in line)
             
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        # Start capturing when we see the config header
-                        if "Current Configuration" in line or "═" in line:
-                            in_config = True
-                            print(line)
-                        # Stop if we see measurement indicators
-                        elif "Measurement #" in line or "ENVIRONMENTAL" in line:
-                            break
-                        # Print config lines
-                        elif in_config:
-                            print(line)
-                            # Stop after the final separator or tip
-                            if "Tip:" in line or ("═" in line and in_config and "Configuration" not in line):
-                                # Read one more line after tip
-                                time.sleep(0.1)
-                                if self.ser.in_waiting:
-                                    extra = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                                    if extra:
-                                        print(extra)
-                                break
-                else:
-                    time.sleep(0.1)
+            # Read one more line after tip
+            if lines and "Tip:" in lines[-1]:
+                self._read_response(0.1, stop=lambda line: True)
         else:
             print("Failed to send config command")
     
@@ -370,26 +506,13 @@ class SEN66CLI:
         """Set a configuration value"""
         print(f"\nSetting {key} to {value}...")
         
-        if self.send_command(f"prefs {key} {value}"):
-            time.sleep(0.5)
-            
-            # Read response, filtering out measurement data
-            timeout = time.time() + 3
-            
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        # Print response lines but stop if we see measurements
-                        if "Measurement #" in line or "ENVIRONMENTAL" in line:
-                            break
-                        print(line)
-                        # Stop after confirmation messages
-                        if "interval set to" in line.lower() or "saved to NVS" in line:
-                            time.sleep(0.2)  # Brief pause
-                            break
-                else:
-                    time.sleep(0.1)
+        if self.send_command(f"prefs {key} {value}".encode()):
+            def confirmed(line):
+                return "interval set to" in line.lower() or "saved to NVS" in line
+                
+            # Read response until a confirmation message, stopping if we
+            # see measurements
+            self._read_response(3, abort=_MEASUREMENT_START_RE.search, stop=confirmed)
         else:
             print("Failed to send prefs command")
     
@@ -412,27 +535,15 @@ class SEN66CLI:
             
             print(f"\n🌍 Setting UTC offset to {offset:+d} hours...")
             
-            if self.send_command(f"prefs utc {offset}"):
-                time.sleep(0.5)
-                
-                # Read response, filtering out measurement data
-                timeout = time.time() + 3
-                
-                while time.time() < timeout:
-                    if self.ser.in_waiting:
-                        line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                        if line:
-                            # Print response lines but stop if we see measurements
-                            if "Measurement #" in line or "ENVIRONMENTAL" in line:
-                                break
-                            print(line)
-                            # Stop after confirmation messages
-                            if "utc offset set to" in line.lower() or "saved to NVS" in line:
-                                print(f"✓ Timezone set to UTC{offset:+d}")
-                                time.sleep(0.2)  # Brief pause
-                                break
-                    else:
-                        time.sleep(0.1)
+            if self.send_command(f"prefs utc {offset}".encode('ascii')):
+                def confirmed(line):
+                    return "utc offset set to" in line.lower() or "saved to NVS" in line
+                    
+                # Read response until a confirmation message, stopping if we
+                # see measurements
+                lines = self._read_response(3, abort=_MEASUREMENT_START_RE.search, stop=confirmed)
+                if lines and confirmed(lines[-1]):
+                    print(f"✓ Timezone set to UTC{offset:+d}")
                 return True
             else:
                 print("Failed to send UTC offset command")
@@ -446,29 +557,16 @@ class SEN66CLI:
     def export_twa_data(self, output_file=None):
         """Export CSV with OSHA-compliant TWA calculations"""
         if output_file is None:
-            import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"twa_export_{timestamp}.csv"
             
         print("\n📊 Generating OSHA-compliant 8-hour TWA export...")
         
         if self.send_command("export_twa"):
-            time.sleep(2.0)  # Give more time for TWA calculations
-            
-            # Read TWA calculation results
-            response_lines = []
-            timeout = time.time() + 10
-            
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        print(line)  # Show TWA calculation progress
-                        response_lines.append(line)
-                        if "Export file:" in line or "TWA export failed" in line:
-                            break
-                else:
-                    time.sleep(0.1)
+            # Read and show TWA calculation progress; the budget includes the
+            # time the board needs for the calculations
+            response_lines = self._read_response(
+                12, stop=lambda line: "Export file:" in line or "TWA export failed" in line)
             
             # If export succeeded, download the TWA file
             if any("Export file:" in line for line in response_lines):
@@ -485,7 +583,6 @@ class SEN66CLI:
         """Download the CSV log file"""
         # Add timestamp to filename if using default
         if output_file is None or output_file == 'sensor_log.csv':
-            import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"sensor_log_{timestamp}.csv"
         
@@ -507,90 +604,152 @@ class SEN66CLI:
             dump_command = "dump"
             
         if self.send_command(dump_command):
-            time.sleep(1.0)  # Give board more time to start sending
+            # Stream the dump output straight to disk; reading blocks until the
+            # board starts sending, so no start-up delay is needed
+            output_path = Path(output_file)
+            csv_rows, comment_count = self._capture_csv(output_path, 11)
             
-            # Read the dump output
-            csv_lines = []
-            comment_lines = []
+            if csv_rows > 0:
+                data_lines = csv_rows - 1  # Subtract header
+                print(f"✓ Downloaded {data_lines} data rows to {output_path}")
+                if comment_count:
+                    print(f"  Including {comment_count} metadata comment lines")
+                print(f"  File size: {output_path.stat().st_size} bytes")
+                return True
+            else:
+                print("✗ No CSV data received. Log file may be empty or corrupted.")
+                return False
+        else:
+            return False
+                
+    def _echo(self, lines):
+        """Decode a batch of raw lines in one pass, write it to stdout and clear it"""
+        if lines:
+            lines.append(b'')
+            sys.stdout.write(b'\n'.join(lines).decode('utf-8', errors='replace'))
+            sys.stdout.flush()
+            lines.clear()
             
-            timeout = time.time() + 10
-            header_found = False
+    def _capture_csv(self, output_path, timeout, echo=False, stop=None):
+        """Stream a tagged CSV dump to output_path; returns (csv_rows, comment_count)"""
+        comment_lines = []  # Held back until the first row so they top the file
+        comment_count = 0
+        csv_rows = 0
+        bytes_written = 0
+        header_found = False
+        echo_lines = []
+        show_progress = not echo and sys.stdout.isatty()
+        # Rows go to a temporary file that only replaces output_path once the
+        # capture ends normally, so an empty, interrupted or failed dump leaves
+        # an existing file untouched
+        part_path = output_path.with_name(output_path.name + '.part')
+        f = None
+        completed = False
+        
+        try:
+            # Per-line lookups hoisted out of the loop
+            match_data_line = _DATA_LINE_RE.match
+            match_tag = _DUMP_TAG_RE.match
             
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    try:
-                        # Read raw bytes first
-                        raw_line = self.ser.readline()
-                        # Decode to string, replacing any problematic characters
-                        line = raw_line.decode('utf-8', errors='replace').strip()
-                    except:
-                        continue
+            for raw_line in self._read_raw_lines(timeout):
+                line = raw_line.strip()
+                
+                if echo and line:
+                    echo_lines.append(line)
+                    if len(echo_lines) >= _ECHO_BATCH_LINES:
+                        self._echo(echo_lines)
                     
-                    # Look for lines that start with [ followed by content and ]
-                    if line.startswith("[") and "]" in line:
-                        # Extract the part after ]
-                        bracket_end = line.index("]")
-                        bracket_content = line[1:bracket_end].strip()
-                        csv_content = line[bracket_end + 1:].strip()
+                # Match the line tag and validate the CSV part on the raw bytes;
+                # rows are written to the file as received, without decoding
+                row = None
+                data_match = match_data_line(line)
+                if data_match:
+                    # Capture data lines, skipping those with excessive non-printable characters
+                    csv_content = data_match.group(1)
+                    if len(csv_content.translate(None, _NON_CONTROL_BYTES)) * 5 < len(csv_content):
+                        row = csv_content
+                else:
+                    tag_match = match_tag(line)
+                    if tag_match:
+                        bracket_content = tag_match.group(1)
+                        csv_content = tag_match.group(2).strip()
                         
                         # Capture comment lines
-                        if bracket_content == "COMMENT":
-                            comment_lines.append(csv_content)
+                        if bracket_content == b"COMMENT":
+                            comment_count += 1
+                            if csv_rows:
+                                write(b'# ' + csv_content + b'\n')
+                            else:
+                                comment_lines.append(csv_content)
                         # Capture header line
-                        elif bracket_content == "HEADER" and "," in csv_content:
+                        elif bracket_content == b"HEADER" and b"," in csv_content:
                             # Skip obviously corrupted headers (lots of non-printable characters)
-                            non_printable_count = sum(1 for c in csv_content if ord(c) < 32 and c not in '\n\r\t')
-                            if not header_found and non_printable_count < len(csv_content) * 0.2:
-                                csv_lines.append(csv_content)
+                            non_printable_count = len(csv_content.translate(None, _NON_CONTROL_BYTES))
+                            if not header_found and non_printable_count * 5 < len(csv_content):
+                                row = csv_content
                                 header_found = True
-                        # Capture data lines (numbers only)
-                        elif bracket_content.isdigit() and "," in csv_content:
-                            # Skip lines with excessive non-printable characters
-                            non_printable_count = sum(1 for c in csv_content if ord(c) < 32 and c not in '\n\r\t')
-                            if non_printable_count < len(csv_content) * 0.2:
-                                csv_lines.append(csv_content)
-                    elif "Displayed" in line and "lines" in line:
-                        break
-                else:
-                    time.sleep(0.1)
+                    # End-of-dump summary from dump ("Displayed N lines") or dump_twa
+                    elif (b"Displayed" in line and b"lines" in line) or line.startswith(b"Total lines:"):
+                        # With a caller's stop, keep going so the output that
+                        # follows the summary is read (and echoed) in this pass
+                        if stop is None:
+                            break
+                        
+                if row is not None:
+                    if f is None:
+                        # Nothing is created on disk until there is a row to write
+                        f = open(part_path, 'wb', buffering=65536)
+                        write = f.write
+                        # Write comment lines first
+                        if comment_lines:
+                            write(b''.join(b'# ' + comment + b'\n' for comment in comment_lines) + b'#\n')
+                    write(row)
+                    write(b'\n')
+                    csv_rows += 1
+                    bytes_written += len(row) + 1
                     
-            if len(csv_lines) > 0:
-                # Write to file with proper newlines
-                output_path = Path(output_file)
-                with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                    # Write comment lines first
-                    if comment_lines:
-                        for comment in comment_lines:
-                            f.write(f'# {comment}\n')
-                        f.write('#\n')
-                    # Write CSV data
-                    f.write('\n'.join(csv_lines))
-                    f.write('\n')
+                    if show_progress and csv_rows & 0xff == 0:
+                        sys.stdout.write(f'\r  {csv_rows} rows, {bytes_written // 1024} KiB')
+                        sys.stdout.flush()
                     
-                data_lines = len(csv_lines) - 1 if len(csv_lines) > 0 else 0  # Subtract header
-                print(f"✓ Downloaded {data_lines} data rows to {output_path}")
-                if comment_lines:
-                    print(f"  Including {len(comment_lines)} metadata comment lines")
-                print(f"  File size: {output_path.stat().st_size} bytes")
-                return True
-            else:
-                print("✗ No CSV data received. Log file may be empty or corrupted.")
-                return False
-        else:
-            return False
-                
+                # Stop when we see the caller's end-of-output message
+                if stop and stop(line):
+                    break
+            completed = True
+        finally:
+            self._echo(echo_lines)
+            if show_progress and csv_rows >= 0x100:
+                sys.stdout.write(f'\r  {csv_rows} rows, {bytes_written // 1024} KiB\n')
+            if f is not None:
+                f.close()
+                if completed:
+                    os.replace(part_path, output_path)
+                else:
+                    part_path.unlink()
+            
+        return csv_rows, comment_count
+        
     def monitor(self):
         """Monitor live output from the board"""
         print("\nMonitoring live data (Press Ctrl+C to stop)...\n")
         
+        # Block in the driver until data arrives. A pending serial read can't be
+        # interrupted by Ctrl+C on Windows, so wake up once a second there.
+        read_timeout = 1 if sys.platform == 'win32' else None
+        
+        # Received lines are passed to stdout as bytes, skipping print()'s
+        # per-line decode and re-encode
+        sys.stdout.flush()
+        write = sys.stdout.buffer.write
+        flush = sys.stdout.buffer.flush
+        
         try:
             while True:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
+                for raw_line in self._read_raw_lines(read_timeout):
+                    line = raw_line.strip()
                     if line:
-                        print(line)
-                else:
-                    time.sleep(0.1)
+                        write(line + b'\n')
+                        flush()
         except KeyboardInterrupt:
             print("\n\nMonitoring stopped.")
     
@@ -599,37 +758,17 @@ class SEN66CLI:
         print("\nRetrieving metadata...")
         
         if self.send_command("metadata"):
-            time.sleep(0.5)
+            # Read response from the metadata header up to the tip, filtering
+            # out measurement data
+            lines = self._read_response(
+                3,
+                start=lambda line: "Current Metadata" in line or "═" in line,
+                abort=_MEASUREMENT_START_RE.search,
+                stop=lambda line: "Tip:" in line)
             
-            # Read response, filtering out measurement data
-            timeout = time.time() + 3
-            in_metadata = False
-            
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        # Start capturing when we see the metadata header
-                        if "Current Metadata" in line or "═" in line:
-                            in_metadata = True
-                            print(line)
-                        # Stop if we see measurement indicators
-                        elif "Measurement #" in line or "ENVIRONMENTAL" in line:
-                            break
-                        # Print metadata lines
-                        elif in_metadata:
-                            print(line)
-                            # Stop after the final separator or tip
-                            if "Tip:" in line or ("═" in line and in_metadata):
-                                # Read one more line after tip
-                                time.sleep(0.1)
-                                if self.ser.in_waiting:
-                                    extra = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                                    if extra:
-                                        print(extra)
-                                break
-                else:
-                    time.sleep(0.1)
+            # Read one more line after tip
+            if lines and "Tip:" in lines[-1]:
+                self._read_response(0.1, stop=lambda line: True)
         else:
             print("Failed to send metadata command")
     
@@ -637,31 +776,15 @@ class SEN66CLI:
         """Set a metadata value with optional user confirmation for log clearing"""
         print(f"\nSetting metadata: {key} = {value}...")
         
-        if self.send_command(f"meta {key} {value}"):
-            time.sleep(0.5)
+        if self.send_command(f"meta {key} {value}".encode()):
+            # Read initial response until the board asks for a choice (a prompt
+            # without a newline) or the operation completes
+            lines = self._read_response(
+                5, partial=0.1,
+                stop=_META_PROMPT_DONE_RE.search)
             
-            # Read initial response
-            lines = []
-            timeout = time.time() + 5
-            waiting_for_input = False
-            
-            while time.time() < timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        print(line)
-                        lines.append(line)
-                        
-                        # Check if board is waiting for user input
-                        if "Your choice:" in line or "choice:" in line.lower():
-                            waiting_for_input = True
-                            break
-                        
-                        # Check if operation completed
-                        if "Metadata set:" in line or "cancelled" in line.lower() or "unchanged" in line.lower():
-                            return
-                else:
-                    time.sleep(0.1)
+            # Check if board is waiting for user input
+            waiting_for_input = bool(lines) and "choice:" in lines[-1].lower()
             
             # If board is waiting for input, handle the interaction
             if waiting_for_input and interactive:
@@ -671,140 +794,39 @@ class SEN66CLI:
                 # If user chose to download/dump, capture and save the CSV
                 if choice == "download" or choice == "dump":
                     print("\n📥 Downloading CSV file before metadata change...")
-                    time.sleep(1.5)  # Give board more time to start dumping
                     
                     # Generate timestamped filename
-                    import datetime
                     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                     backup_filename = f"sensor_log_backup_{timestamp}.csv"
                     
-                    # Capture CSV output using identical logic to download_log()
-                    csv_lines = []
-                    comment_lines = []
-                    
-                    dump_timeout = time.time() + 15
-                    header_found = False
-                    
-                    while time.time() < dump_timeout:
-                        if self.ser.in_waiting:
-                            try:
-                                # Read raw bytes first
-                                raw_line = self.ser.readline()
-                                # Decode to string, replacing any problematic characters
-                                line = raw_line.decode('utf-8', errors='replace').strip()
-                            except:
-                                continue
-                            
-                            if line:
-                                print(line)
-                                
-                                # Look for lines that start with [ followed by content and ]
-                                if line.startswith("[") and "]" in line:
-                                    # Extract the part after ]
-                                    bracket_end = line.index("]")
-                                    bracket_content = line[1:bracket_end].strip()
-                                    csv_content = line[bracket_end + 1:].strip()
-                                    
-                                    # Capture comment lines
-                                    if bracket_content == "COMMENT":
-                                        comment_lines.append(csv_content)
-                                    # Capture header line
-                                    elif bracket_content == "HEADER" and "," in csv_content:
-                                        # Skip obviously corrupted headers (lots of non-printable characters)
-                                        non_printable_count = sum(1 for c in csv_content if ord(c) < 32 and c not in '\n\r\t')
-                                        if not header_found and non_printable_count < len(csv_content) * 0.2:
-                                            csv_lines.append(csv_content)
-                                            header_found = True
-                                    # Capture data lines (numbers only)
-                                    elif bracket_content.isdigit() and "," in csv_content:
-                                        # Skip lines with excessive non-printable characters
-                                        non_printable_count = sum(1 for c in csv_content if ord(c) < 32 and c not in '\n\r\t')
-                                        if non_printable_count < len(csv_content) * 0.2:
-                                            csv_lines.append(csv_content)
-                                elif "Displayed" in line and "lines" in line:
-                                    break
-                                
-                                # Stop when we see the info message after output
-                                if "CSV output complete" in line or "You can now set metadata safely." in line:
-                                    break
-                        else:
-                            time.sleep(0.1)
+                    # Capture CSV output using identical logic to download_log(), reading
+                    # on through the board's closing "You can now:" message. The capture
+                    # blocks on the port, so there's no need to wait for the board to
+                    # start dumping first
+                    output_path = Path(backup_filename)
+                    csv_rows, comment_count = self._capture_csv(
+                        output_path, 15, echo=True,
+                        stop=_META_DOWNLOAD_DONE_RE.search)
                     
-                    # Save the CSV file using identical format to download_log()
-                    if csv_lines:
-                        output_path = Path(backup_filename)
-                        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                            # Write comment lines first
-                            if comment_lines:
-                                for comment in comment_lines:
-                                    f.write(f'# {comment}\n')
-                                f.write('#\n')
-                            # Write CSV data
-                            f.write('\n'.join(csv_lines))
-                            f.write('\n')
-                        
-                        data_lines = len(csv_lines) - 1 if len(csv_lines) > 0 else 0  # Subtract header
+                    if csv_rows:
+                        data_lines = csv_rows - 1  # Subtract header
                         print(f"\n✅ CSV file saved to: {backup_filename}")
                         print(f"   {data_lines} data rows saved")
-                        if comment_lines:
-                            print(f"   Including {len(comment_lines)} metadata comment lines")
+                        if comment_count:
+                            print(f"   Including {comment_count} metadata comment lines")
                         print(f"   File size: {output_path.stat().st_size} bytes\n")
                     else:
                         print("\n⚠ Warning: No CSV data captured (file may be empty)\n")
-                    
-                    # Continue reading until operation completes
-                    final_timeout = time.time() + 5
-                    while time.time() < final_timeout:
-                        if self.ser.in_waiting:
-                            line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                            if line:
-                                print(line)
-                                if "can now:" in line.lower() or "cancelled" in line.lower():
-                                    break
-                        else:
-                            time.sleep(0.1)
-                            if not self.ser.in_waiting:
-                                break
                 else:
                     # For "yes" or other responses, just read the outcome
                     time.sleep(1.0)
-                    response_timeout = time.time() + 10
-                    while time.time() < response_timeout:
-                        if self.ser.in_waiting:
-                            line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                            if line:
-                                print(line)
-                                if "Metadata set:" in line or "cancelled" in line.lower():
-                                    break
-                        else:
-                            time.sleep(0.1)
-                            if not self.ser.in_waiting:
-                                break
+                    self._read_response(10, idle=0.1, stop=_META_SET_DONE_RE.search)
         else:
             print("Failed to send meta command")
     
     def show_about(self):
         """Display project information and license"""
-        print("\n" + "="*80)
-        print("  OSH-Monitor Project Information")
-        print("="*80)
-        print("\nProject: OSH-Monitor")
-        print("Creator: Christopher Lee")
-        print("License: GNU General Public License v3.0 (GPLv3)")
-        print("\nDescription:")
-        print("  Advanced air quality monitoring system with the Sensirion SEN66 sensor")
-        print("  Features real-time measurements, 8-hour TWA calculations, CSV logging,")
-        print("  and localized timestamps with configurable UTC offset.")
-        print("\nLicense Notice:")
-        print("  This program is free software: you can redistribute it and/or modify")
-        print("  it under the terms of the GNU General Public License as published by")
-        print("  the Free Software Foundation, either version 3 of the License, or")
-        print("  (at your option) any later version.")
-        print("\n  This program is distributed in the hope that it will be useful,")
-        print("  but WITHOUT ANY WARRANTY; without even the implied warranty of")
-        print("  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the")
-        print("  GNU General Public License for more details.")
-        print("\n" + "="*80 + "\n")
+        sys.stdout.write(_ABOUT_TEXT)
     
     def reset_metadata(self):
         """Reset all metadata to default state"""
@@ -825,27 +847,18 @@ class SEN66CLI:
         self.flush_input_buffer()
         
         if self.send_command("resetmeta"):
-            # Wait for the board to process
-            time.sleep(0.5)
-            
+            # Wait for the board's confirmation prompt; its warning repeats the
+            # one printed above, so it isn't shown
+            for line in self._read_lines(2, partial=0.1):
+                if "Type 'yes' to confirm" in line:
+                    break
+                    
             # Send 'yes' confirmation to the board
             self.ser.write(b'yes\n')
-            self.ser.flush()
             
             # Read response
             time.sleep(1.0)
-            response_timeout = time.time() + 5
-            while time.time() < response_timeout:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        print(line)
-                        if "reset to defaults" in line.lower() or "cancelled" in line.lower():
-                            break
-                else:
-                    time.sleep(0.1)
-                    if not self.ser.in_waiting:
-                        break
+            self._read_response(5, idle=0.1, stop=_RESET_DONE_RE.search)
             return True
         else:
             print("Failed to send resetmeta command")
@@ -870,31 +883,123 @@ def list_ports():
         print()
 
 
+# Command list shown by the interactive console
+_INTERACTIVE_HELP = """
+Commands:
+  status              - Show current measurement
+  storage, stor       - Show filesystem storage stats
+  clear               - Clear log file
+  download [file]     - Download log (default: sensor_log.csv)
+  export_twa [file]   - Export 8-hour TWA calculations
+  rtc status          - Show ESP32 RTC status
+  rtc sync            - Synchronize ESP32 RTC
+  config              - Show current configuration
+  prefs <key> <value> - Set config (measurement, logging, utc, storage_warning)
+  timezone <offset>   - Set UTC offset hours (-12 to +14)
+  metadata            - Show all metadata
+  meta <key> <value>  - Set metadata (user, project, location)
+  resetmeta           - Reset all metadata to defaults
+  monitor             - Monitor live data (Ctrl+C to stop)
+  list-ports          - List available serial ports
+  about               - Show project information and license
+  help                - Show this help
+  exit, quit          - Exit console
+"""
+
+# Interactive console startup banner
+_CONSOLE_BANNER = "\n" + "=" * 60 + "\n  OSH-Monitor Interactive Console\n" + "=" * 60 + "\n" + _INTERACTIVE_HELP + "\n"
+
+# Actions accepted on the command line (in the order shown by --help)
+_CLI_COMMANDS = ('status', 'storage', 'clear', 'download', 'export-twa', 'monitor', 'rtc-status', 'rtc-sync',
+                 'config', 'set', 'metadata', 'meta', 'timezone', 'utc', 'about', 'list-ports', 'console')
+
+
+def _console_download(cli, rest):
+    args = rest.split()
+    output_file = args[0] if args else 'sensor_log.csv'
+    cli.download_log(output_file)
+
+
+def _console_export_twa(cli, rest):
+    args = rest.split()
+    output_file = args[0] if args else None
+    cli.export_twa_data(output_file)
+
+
+def _console_rtc(cli, rest):
+    args = rest.split()
+    if args and args[0] == 'status':
+        cli.rtc_status()
+    elif args and args[0] == 'sync':
+        cli.rtc_sync()
+    else:
+        print("Usage: rtc <status|sync>")
+        print("  rtc status  - Show ESP32 RTC status")
+        print("  rtc sync    - Synchronize ESP32 RTC")
+
+
+def _console_prefs(cli, rest):
+    args = rest.split()
+    if len(args) >= 2:
+        cli.set_config(args[0], args[1])
+    else:
+        print("Usage: prefs <key> <value>")
+        print("Keys: measurement, logging, utc")
+        print("Example: prefs utc -5  (for EST timezone)")
+
+
+def _console_timezone(cli, rest):
+    args = rest.split()
+    if len(args) >= 1:
+        cli.set_timezone(args[0])
+    else:
+        print("Usage: timezone <offset>")
+        print("Set UTC offset in hours (-12 to +14)")
+        print("Examples: timezone -5  (EST), timezone +9  (JST)")
+
+
+def _console_meta(cli, rest):
+    # The value is everything after the key, with its spacing kept as typed
+    args = rest.split(maxsplit=1)
+    if len(args) >= 2:
+        cli.set_metadata(args[0], args[1])
+    else:
+        print("Usage: meta <key> <value>")
+        print("Common keys: user, project, location")
+
+
+def _console_monitor(cli, rest):
+    print("\nPress Ctrl+C to stop monitoring...\n")
+    cli.monitor()
+
+
+# Interactive console commands that need a board connection, mapped to
+# handlers taking (cli, rest), rest being the input after the command word
+_CONSOLE_COMMANDS = {
+    'status': lambda cli, rest: cli.get_status(),
+    'storage': lambda cli, rest: cli.show_storage(),
+    'stor': lambda cli, rest: cli.show_storage(),
+    'clear': lambda cli, rest: cli.clear_log(),
+    'download': _console_download,
+    'twa': _console_export_twa,
+    'export_twa': _console_export_twa,
+    'rtc': _console_rtc,
+    'config': lambda cli, rest: cli.show_config(),
+    'prefs': _console_prefs,
+    'set': _console_prefs,  # Accept both for compatibility
+    'timezone': _console_timezone,
+    'utc': _console_timezone,
+    'metadata': lambda cli, rest: cli.show_metadata(),
+    'meta': _console_meta,
+    'resetmeta': lambda cli, rest: cli.reset_metadata(),
+    'about': lambda cli, rest: cli.show_about(),
+    'monitor': _console_monitor,
+}
+
+
 def interactive_mode(port=None, baudrate=115200):
     """Run CLI in interactive console mode"""
-    print("\n" + "="*60)
-    print("  OSH-Monitor Interactive Console")
-    print("="*60)
-    print("\nCommands:")
-    print("  status              - Show current measurement")
-    print("  storage, stor       - Show filesystem storage stats")
-    print("  clear               - Clear log file")
-    print("  download [file]     - Download log (default: sensor_log.csv)")
-    print("  export_twa [file]   - Export 8-hour TWA calculations")
-    print("  rtc status          - Show ESP32 RTC status")
-    print("  rtc sync            - Synchronize ESP32 RTC")
-    print("  config              - Show current configuration")
-    print("  prefs <key> <value> - Set config (measurement, logging, utc)")
-    print("  timezone <offset>   - Set UTC offset hours (-12 to +14)")
-    print("  metadata            - Show all metadata")
-    print("  meta <key> <value>  - Set metadata (user, project, location)")
-    print("  resetmeta           - Reset all metadata to defaults")
-    print("  monitor             - Monitor live data (Ctrl+C to stop)")
-    print("  list-ports          - List available serial ports")
-    print("  about               - Show project information and license")
-    print("  help                - Show this help")
-    print("  exit, quit          - Exit console")
-    print()
+    sys.stdout.write(_CONSOLE_BANNER)
     
     # Create CLI instance
     cli = SEN66CLI(port=port, baudrate=baudrate)
@@ -912,9 +1017,9 @@ def interactive_mode(port=None, baudrate=115200):
             if not cmd_input:
                 continue
                 
-            parts = cmd_input.split()
+            parts = cmd_input.split(maxsplit=1)
             cmd = parts[0].lower()
-            args = parts[1:] if len(parts) > 1 else []
+            rest = parts[1] if len(parts) > 1 else ''
             
             # Handle exit commands
             if cmd in ['exit', 'quit', 'q']:
@@ -923,25 +1028,7 @@ def interactive_mode(port=None, baudrate=115200):
                 
             # Handle help
             if cmd in ['help', '?']:
-                print("\nCommands:")
-                print("  status              - Show current measurement")
-                print("  storage, stor       - Show filesystem storage stats")
-                print("  clear               - Clear log file")
-                print("  download [file]     - Download log (default: sensor_log.csv)")
-                print("  export_twa [file]   - Export 8-hour TWA calculations")
-                print("  rtc status          - Show ESP32 RTC status")
-                print("  rtc sync            - Synchronize ESP32 RTC")
-                print("  config              - Show current configuration")
-                print("  prefs <key> <value> - Set config (measurement, logging, utc, storage_warning)")
-                print("  timezone <offset>   - Set UTC offset hours (-12 to +14)")
-                print("  metadata            - Show all metadata")
-                print("  meta <key> <value>  - Set metadata (user, project, location)")
-                print("  resetmeta           - Reset all metadata to defaults")
-                print("  monitor             - Monitor live data (Ctrl+C to stop)")
-                print("  list-ports          - List available serial ports")
-                print("  about               - Show project information and license")
-                print("  help                - Show this help")
-                print("  exit, quit          - Exit console")
+                sys.stdout.write(_INTERACTIVE_HELP)
                 continue
                 
             # Handle list-ports without connection
@@ -957,83 +1044,12 @@ def interactive_mode(port=None, baudrate=115200):
                 connected = True
                 
             # Execute commands
-            if cmd == 'status':
-                cli.get_status()
-            elif cmd == 'storage' or cmd == 'stor':
-                cli.show_storage()
-            elif cmd == 'clear':
-                cli.clear_log()
-            elif cmd == 'download':
-                output_file = args[0] if args else 'sensor_log.csv'
-                cli.download_log(output_file)
-            elif cmd == 'twa' or cmd == 'export_twa':
-                output_file = args[0] if args else None
-                cli.export_twa_data(output_file)
-            elif cmd == 'rtc':
-                if len(args) >= 1:
-                    if args[0] == 'status':
-                        cli.rtc_status()
-                    elif args[0] == 'sync':
-                        cli.rtc_sync()
-                    else:
-                        print("Usage: rtc <status|sync>")
-                        print("  rtc status  - Show ESP32 RTC status")
-                        print("  rtc sync    - Synchronize ESP32 RTC")
-                else:
-                    print("Usage: rtc <status|sync>")
-                    print("  rtc status  - Show ESP32 RTC status")
-                    print("  rtc sync    - Synchronize ESP32 RTC")
-            elif cmd == 'config':
-                cli.show_config()
-            elif cmd == 'prefs' or cmd == 'set':  # Accept both for compatibility
-                if len(args) >= 2:
-                    cli.set_config(args[0], args[1])
-                else:
-                    print("Usage: prefs <key> <value>")
-                    print("Keys: measurement, logging, utc")
-                    print("Example: prefs utc -5  (for EST timezone)")
-            elif cmd == 'timezone' or cmd == 'utc':
-                if len(args) >= 1:
-                    cli.set_timezone(args[0])
-                else:
-                    print("Usage: timezone <offset>")
-                    print("Set UTC offset in hours (-12 to +14)")
-                    print("Examples: timezone -5  (EST), timezone +9  (JST)")
-            elif cmd == 'metadata':
-                cli.show_metadata()
-            elif cmd == 'meta':
-                if len(args) >= 2:
-                    cli.set_metadata(args[0], ' '.join(args[1:]))  # Join in case value has spaces
-                else:
-                    print("Usage: meta <key> <value>")
-                    print("Common keys: user, project, location")
-            elif cmd == 'resetmeta':
-                cli.reset_metadata()
-            elif cmd == 'about':
-                cli.show_about()
-            elif cmd == 'monitor':
-                print("\nPress Ctrl+C to stop monitoring...\n")
-                cli.monitor()
+            handler = _CONSOLE_COMMANDS.get(cmd)
+            if handler:
+                handler(cli, rest)
             else:
-                print(f"\n❌ Unknown command: '{cmd}'\n")
-                print("Available commands:")
-                print("  status              - Show current measurement")
-                print("  clear               - Clear log file")
-                print("  download [file]     - Download log (default: sensor_log.csv)")
-                print("  export_twa [file]   - Export 8-hour TWA calculations")
-                print("  rtc status          - Show ESP32 RTC status")
-                print("  rtc sync            - Synchronize ESP32 RTC")
-                print("  config              - Show current configuration")
-                print("  prefs <key> <value> - Set config (measurement, logging, utc)")
-                print("  timezone <offset>   - Set UTC offset hours (-12 to +14)")
-                print("  metadata            - Show all metadata")
-                print("  meta <key> <value>  - Set metadata (user, project, location)")
-                print("  resetmeta           - Reset all metadata to defaults")
-                print("  monitor             - Monitor live data (Ctrl+C to stop)")
-                print("  list-ports          - List available serial ports")
-                print("  about               - Show project information and license")
-                print("  help                - Show this help")
-                print("  exit, quit          - Exit console")
+                print(f"\n❌ Unknown command: '{cmd}'")
+                sys.stdout.write(_INTERACTIVE_HELP)
                 
         except KeyboardInterrupt:
             print("\n")
@@ -1072,7 +1088,7 @@ Examples:
     
     parser.add_argument('command', 
                        nargs='?',
-                       choices=['status', 'storage', 'clear', 'download', 'export-twa', 'monitor', 'rtc-status', 'rtc-sync', 'config', 'set', 'metadata', 'meta', 'timezone', 'utc', 'about', 'list-ports', 'console'],
+                       choices=_CLI_COMMANDS,
                        help='Command to execute (omit for interactive mode)')
     parser.add_argument('--port', '-p',
                        help='Serial port (e.g., COM5, /dev/ttyUSB0)')
@@ -1158,26 +1174,6 @@ Examples:
             cli.show_about()
         elif args.command == 'monitor':
             cli.monitor()
-        else:
-            print(f"\n❌ Unknown command: '{args.command}'\n")
-            print("Available commands:")
-            print("  status              - Show current measurement")
-            print("  clear               - Clear log file")
-            print("  download            - Download CSV log file")
-            print("  export-twa          - Export 8-hour TWA calculations")
-            print("  rtc-status          - Show ESP32 RTC status")
-            print("  rtc-sync            - Synchronize ESP32 RTC")
-            print("  config              - Show current configuration")
-            print("  set                 - Set configuration value")
-            print("  timezone            - Set UTC offset (timezone)")
-            print("  metadata            - Show all metadata")
-            print("  meta                - Set metadata value")
-            print("  monitor             - Monitor live data")
-            print("  about               - Show project information and license")
-            print("  list-ports          - List available serial ports")
-            print("  console             - Start interactive console")
-            print("\nUse --help for detailed usage information")
-            return 1
             
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")